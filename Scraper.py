@@ -1,10 +1,5 @@
 import requests
 from bs4 import BeautifulSoup
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
 import time
 import re
 from urllib.parse import urljoin, urlparse
@@ -12,6 +7,10 @@ from urllib.parse import urljoin, urlparse
 class CatchDesMoinesEventScraper:
     def __init__(self, headless=True):
         """Initialize the scraper with Chrome WebDriver"""
+        # Selenium is imported here so the requests-only lightweight path
+        # doesn't pay for loading it
+        from selenium.webdriver.chrome.options import Options
+
         self.chrome_options = Options()
         if headless:
             self.chrome_options.add_argument("--headless")
@@ -30,6 +29,11 @@ class CatchDesMoinesEventScraper:
         Returns:
             str: The extracted visit website URL, or None if not found
         """
+        from selenium import webdriver
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+
         driver = None
         try:
             # Initialize the WebDriver
@@ -8,22 +8,34 @@ using Crawl4AI and Claude 4.5 Sonnet for intelligent content extraction.
 
 Features:
 - Crawls event listing pages with pagination
+- Optionally packs several listing pages into each Claude request
 - Extracts individual event details including "Visit Website" URLs
-- Deduplicates against existing database entries
+- Deduplicates against existing database entries, including fuzzy
+  near-duplicates ("The Fall Fest" vs "Fall Fest 2026") on nearby dates
 - Inserts new events into Supabase
+- Optional daemon mode that polls on a schedule, inserts new events and
+  re-crawls and updates events whose listing card changed, with /health and
+  /metrics endpoints
 
 Usage:
-    python catchdesmoines_crawler.py [--dry-run] [--max-pages N]
+    python catchdesmoines_crawler.py [--dry-run] [--max-pages N] [--pack-tokens N]
+    python catchdesmoines_crawler.py --daemon [--interval SECONDS] [--health-port PORT]
 """
 
 import asyncio
+import hashlib
+import importlib
 import json
 import logging
 import os
 import re
+import signal
 import sys
-from datetime import datetime, timedelta
-from typing import Optional
+import threading
+import time
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import TYPE_CHECKING, Optional
 from dateutil import parser as date_parser
 from zoneinfo import ZoneInfo
 
@@ -37,26 +49,56 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Import Crawl4AI
-try:
-    from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig
-except ImportError:
-    logger.error("Crawl4AI not installed. Run: pip install crawl4ai")
-    sys.exit(1)
-
-# Import Anthropic
-try:
+# Heavy dependencies (crawl4ai, anthropic, supabase) are imported lazily when
+# the first crawl, Claude request or database query needs them, so --help,
+# argument errors and config errors don't pay for loading them, and dry runs
+# never load supabase.
+if TYPE_CHECKING:
     import anthropic
-except ImportError:
-    logger.error("Anthropic not installed. Run: pip install anthropic")
-    sys.exit(1)
+    from supabase import Client
+
+
+def _require(module_name: str, package: str):
+    """Import a heavy dependency on first use, exiting with a hint if missing."""
+    try:
+        return importlib.import_module(module_name)
+    except ImportError:
+        logger.error(f"{package} not installed. Run: pip install {package.lower()}")
+        sys.exit(1)
+
+
+async def _to_daemon_thread(func, *args, **kwargs):
+    """
+    Like asyncio.to_thread, but in a daemon thread that doesn't hold up exit.
+
+    Used for slow read-only calls (Claude, index loads) that can be abandoned
+    when the daemon shuts down; database writes keep using asyncio.to_thread
+    so an in-flight insert finishes first.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def resolve(result, error):
+        if future.cancelled():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def worker():
+        try:
+            result, error = func(*args, **kwargs), None
+        except Exception as e:
+            result, error = None, e
+        try:
+            loop.call_soon_threadsafe(resolve, result, error)
+        except RuntimeError:
+            pass  # Event loop already closed
+
+    threading.Thread(target=worker, daemon=True).start()
+    return await future
 
-# Import Supabase
-try:
-    from supabase import create_client, Client
-except ImportError:
-    logger.error("Supabase not installed. Run: pip install supabase")
-    sys.exit(1)
 
 # Configuration
 CATCHDESMOINES_BASE_URL = "https://www.catchdesmoines.com"
@@ -66,35 +108,310 @@ CENTRAL_TZ = ZoneInfo("America/Chicago")
 # Claude 4.5 Sonnet model
 CLAUDE_MODEL = "claude-sonnet-4-5-20250929"
 
+# Near-duplicate detection
+DEDUP_TITLE_THRESHOLD = 0.6   # Trigram Jaccard similarity for titles
+DEDUP_VENUE_THRESHOLD = 0.4   # Trigram Jaccard similarity for venues (when both are known)
+DEDUP_WORD_THRESHOLD = 0.5    # Trigram Jaccard similarity for spelling variants of a title word
+DEDUP_DATE_WINDOW_DAYS = 1    # Only compare events within +/- N days of each other
+DEDUP_PAGE_SIZE = 1000        # Supabase row limit per request
+TITLE_STOPWORDS = frozenset({"the", "a", "an", "annual"})
+TITLE_WORD_VARIANTS = frozenset({frozenset({"fest", "festival"})})  # Word pairs that name the same thing
+
+# Packed extraction (several listing pages per Claude request)
+PACK_CHARS_PER_TOKEN = 4            # Rough input-token estimate for HTML
+PACK_MAX_OUTPUT_TOKENS = 16000      # Keeps packed requests within non-streaming limits
+# One event object in the requested JSON format is roughly 150 tokens with a
+# short description; 250 leaves headroom for longer descriptions and venues
+PACK_OUTPUT_TOKENS_PER_EVENT = 250
+PACK_OUTPUT_TOKENS_PER_PAGE_TAG = 50  # <page_events> wrapper and separators
+PACK_UNKNOWN_PAGE_OUTPUT_TOKENS = 8000  # No event links found: same allowance as a single-page request
+PACK_CONCURRENCY = 3                # Packed requests in flight at once
+
+# Daemon mode
+DAEMON_INTERVAL_SECONDS = 900            # Listing poll interval
+DAEMON_INDEX_REFRESH_SECONDS = 3600      # Reload the near-duplicate index from the database
+DAEMON_STALE_INTERVALS = 3               # Report unhealthy after this many intervals without a good poll
+DAEMON_HEALTH_PORT = 8787
+DAEMON_MAX_TRACKED_CARDS = 20000         # Oldest listing cards are forgotten beyond this
+DAEMON_MAX_RECENT_EVENTS = 500           # Inserted events kept in events_found
+
+# Outcomes of writing an event to the database
+INSERTED = "inserted"
+UPDATED = "updated"
+SKIPPED = "skipped"   # Invalid or past date, not worth retrying
+FAILED = "failed"     # Database or network error, retry on the next poll
+
+
+def _normalize_text(text: str, stopwords: frozenset = frozenset()) -> str:
+    """Lowercase, strip punctuation, years and stopwords for fuzzy comparison."""
+    text = (text or "").lower().replace("&", " and ")
+    text = re.sub(r"\b(?:19|20)\d{2}\b", " ", text)
+    words = [w for w in re.split(r"[^a-z0-9]+", text) if w and w not in stopwords]
+    return " ".join(words)
+
+
+def _trigrams(text: str) -> frozenset:
+    """Character trigrams of a normalized string, padded at word boundaries."""
+    if not text:
+        return frozenset()
+    padded = f" {text} "
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+def _content_hash(text: str) -> str:
+    """SHA-256 hex digest used for change detection."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _jaccard(a: frozenset, b: frozenset) -> float:
+    """Jaccard similarity of two trigram sets."""
+    if not a or not b:
+        return 0.0
+    intersection = len(a & b)
+    return intersection / (len(a) + len(b) - intersection)
+
+
+def _words_match(a: str, b: str) -> bool:
+    """Whether two title words are variants of each other ("fest"/"festival", plurals, typos)."""
+    if a == b:
+        return True
+    if frozenset((a, b)) in TITLE_WORD_VARIANTS:
+        return True
+
+    # Plurals only for words long enough that the "s" is unlikely to change
+    # the meaning ("gardens" but not "pops")
+    shorter, longer = sorted((a, b), key=len)
+    if len(shorter) >= 4 and longer in (f"{shorter}s", f"{shorter}es"):
+        return True
+
+    return _jaccard(_trigrams(a), _trigrams(b)) >= DEDUP_WORD_THRESHOLD
+
+
+def _titles_compatible(a_words: frozenset, b_words: frozenset) -> bool:
+    """
+    Whether every word of each title has a variant in the other.
+
+    Trigram similarity alone treats "Book Club" and "Kids Book Club" as the
+    same event; an extra word on either side means a different event.
+    """
+    for word in a_words ^ b_words:
+        other = b_words if word in a_words else a_words
+        if not any(_words_match(word, candidate) for candidate in other):
+            return False
+    return True
+
+
+class NearDuplicateIndex:
+    """
+    In-memory trigram index of upcoming events, bucketed by Central Time date.
+
+    A match needs similar titles whose words all pair up, a similar venue
+    when both events have one, and dates within the window. Lookups only touch
+    the buckets inside the date window, so the cost of a lookup depends on how
+    many events share those days rather than on the size of the events table.
+    """
+
+    def __init__(
+        self,
+        title_threshold: float = DEDUP_TITLE_THRESHOLD,
+        venue_threshold: float = DEDUP_VENUE_THRESHOLD,
+        date_window_days: int = DEDUP_DATE_WINDOW_DAYS,
+    ):
+        self.title_threshold = title_threshold
+        self.venue_threshold = venue_threshold
+        self.date_window_days = date_window_days
+        self._entries: list = []
+        # day ordinal -> trigram -> entry ids
+        self._buckets: dict = defaultdict(lambda: defaultdict(set))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, title: str, venue: str, event_date: date, label: str = "", ref=None) -> None:
+        """Add an event to the index, with an optional reference such as its row id."""
+        normalized = _normalize_text(title, TITLE_STOPWORDS)
+        title_grams = _trigrams(normalized)
+        if not title_grams:
+            return
+
+        entry_id = len(self._entries)
+        self._entries.append({
+            "label": label or title,
+            "ref": ref,
+            "date": event_date,
+            "title_words": frozenset(normalized.split()),
+            "title_grams": title_grams,
+            "venue_grams": _trigrams(_normalize_text(venue)),
+        })
+
+        postings = self._buckets[event_date.toordinal()]
+        for gram in title_grams:
+            postings[gram].add(entry_id)
+
+    def find(self, title: str, venue: str, event_date: date) -> Optional[str]:
+        """Return the label of a near-duplicate event, or None."""
+        entry = self.find_entry(title, venue, event_date)
+        return entry["label"] if entry else None
+
+    def find_entry(self, title: str, venue: str, event_date: date) -> Optional[dict]:
+        """Return the best near-duplicate entry (with "label", "ref" and "date"), or None."""
+        normalized = _normalize_text(title, TITLE_STOPWORDS)
+        title_grams = _trigrams(normalized)
+        if not title_grams:
+            return None
+        title_words = frozenset(normalized.split())
+        venue_grams = _trigrams(_normalize_text(venue))
+
+        # Count shared trigrams per candidate within the date window
+        overlap: dict = defaultdict(int)
+        day = event_date.toordinal()
+        for ordinal in range(day - self.date_window_days, day + self.date_window_days + 1):
+            postings = self._buckets.get(ordinal)
+            if not postings:
+                continue
+            for gram in title_grams:
+                for entry_id in postings.get(gram, ()):
+                    overlap[entry_id] += 1
+
+        best_entry = None
+        best_score = 0.0
+        for entry_id, shared in overlap.items():
+            entry = self._entries[entry_id]
+            score = shared / (len(title_grams) + len(entry["title_grams"]) - shared)
+            if score < self.title_threshold or score <= best_score:
+                continue
+            if not _titles_compatible(title_words, entry["title_words"]):
+                continue
+            if venue_grams and entry["venue_grams"] and \
+                    _jaccard(venue_grams, entry["venue_grams"]) < self.venue_threshold:
+                continue
+            best_entry = entry
+            best_score = score
+
+        return best_entry
+
 
 class CatchDesMoinesCrawler:
     """Crawler for catchdesmoines.com events."""
 
-    def __init__(self, dry_run: bool = False, max_pages: int = 5):
+    def __init__(
+        self,
+        dry_run: bool = False,
+        max_pages: int = 5,
+        pack_tokens: int = 0,
+        pack_concurrency: int = PACK_CONCURRENCY,
+    ):
         self.dry_run = dry_run
         self.max_pages = max_pages
-        self.supabase: Optional[Client] = None
-        self.anthropic_client: Optional[anthropic.Anthropic] = None
+        self.pack_tokens = pack_tokens
+        self.pack_concurrency = pack_concurrency
+        self._supabase: Optional["Client"] = None
+        self._anthropic_client: Optional["anthropic.Anthropic"] = None
+        self._supabase_url: Optional[str] = None
+        self._supabase_key: Optional[str] = None
+        self._anthropic_key: Optional[str] = None
         self.events_found: list = []
         self.events_inserted: int = 0
+        self.events_updated: int = 0
         self.duplicates_skipped: int = 0
+        self.dedup_index = NearDuplicateIndex()
+
+        # Warm state kept between polls in daemon mode
+        self._browser = None
+        self.page_cache: dict = {}    # listing page -> (content hash, extracted events)
+        self.tracked_cards: dict = {}  # event id -> {"hash", "row_id", "date"} of the last handled listing card
+        self.index_built_at: float = 0.0
+        self.poll_interval: int = DAEMON_INTERVAL_SECONDS
+        self.stats: dict = {
+            "started_at": time.time(),
+            "polls": 0,
+            "poll_failures": 0,
+            "last_success_at": None,
+            "last_poll_duration": 0.0,
+            "page_cache_hits": 0,
+            "events_extracted": 0,
+            "events_changed": 0,
+        }
 
     def _init_clients(self):
-        """Initialize Supabase and Anthropic clients."""
+        """Read client credentials; the clients themselves are created on first use."""
         # Get environment variables
         supabase_url = os.environ.get("SUPABASE_URL")
         supabase_key = os.environ.get("SUPABASE_SERVICE_ROLE_KEY")
         anthropic_key = os.environ.get("ANTHROPIC_API_KEY") or os.environ.get("CLAUDE_API")
 
-        if not supabase_url or not supabase_key:
+        # Dry runs never touch the database
+        if not self.dry_run and (not supabase_url or not supabase_key):
             raise ValueError("SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY must be set")
 
         if not anthropic_key:
             raise ValueError("ANTHROPIC_API_KEY or CLAUDE_API must be set")
 
-        self.supabase = create_client(supabase_url, supabase_key)
-        self.anthropic_client = anthropic.Anthropic(api_key=anthropic_key)
-        logger.info("Initialized Supabase and Anthropic clients")
+        self._supabase_url = supabase_url
+        self._supabase_key = supabase_key
+        self._anthropic_key = anthropic_key
+
+    @property
+    def supabase(self) -> Optional["Client"]:
+        """Supabase client, created on first use; None in dry runs."""
+        if self._supabase is None and not self.dry_run and self._supabase_url:
+            supabase = _require("supabase", "Supabase")
+            self._supabase = supabase.create_client(self._supabase_url, self._supabase_key)
+            logger.info("Initialized Supabase client")
+        return self._supabase
+
+    @supabase.setter
+    def supabase(self, client: Optional["Client"]):
+        self._supabase = client
+
+    @property
+    def anthropic_client(self) -> Optional["anthropic.Anthropic"]:
+        """Anthropic client, created on first use."""
+        if self._anthropic_client is None and self._anthropic_key:
+            anthropic = _require("anthropic", "Anthropic")
+            self._anthropic_client = anthropic.Anthropic(api_key=self._anthropic_key)
+            logger.info("Initialized Anthropic client")
+        return self._anthropic_client
+
+    @anthropic_client.setter
+    def anthropic_client(self, client: Optional["anthropic.Anthropic"]):
+        self._anthropic_client = client
+
+    async def start_browser(self):
+        """Launch a browser that stays open across crawls (daemon mode)."""
+        crawl4ai = _require("crawl4ai", "Crawl4AI")
+        self._browser = crawl4ai.AsyncWebCrawler(config=self._browser_config())
+        await self._browser.start()
+        logger.info("Started shared browser")
+
+    async def close_browser(self):
+        """Close the shared browser, if one was started."""
+        if self._browser:
+            await self._browser.close()
+            self._browser = None
+
+    def _browser_config(self):
+        """Browser settings shared by all crawls."""
+        crawl4ai = _require("crawl4ai", "Crawl4AI")
+        return crawl4ai.BrowserConfig(
+            headless=True,
+            verbose=False,
+        )
+
+    async def _crawl_url(self, url: str, page_timeout: int):
+        """Crawl a URL with the shared browser, or a short-lived one if none is running."""
+        crawl4ai = _require("crawl4ai", "Crawl4AI")
+
+        crawler_config = crawl4ai.CrawlerRunConfig(
+            wait_until="networkidle",
+            page_timeout=page_timeout,
+        )
+
+        if self._browser:
+            return await self._browser.arun(url, config=crawler_config)
+
+        async with crawl4ai.AsyncWebCrawler(config=self._browser_config()) as crawler:
+            return await crawler.arun(url, config=crawler_config)
 
     async def crawl_events_list(self, page: int = 0) -> str:
         """Crawl the events listing page."""
@@ -104,57 +421,35 @@ class CatchDesMoinesCrawler:
 
         logger.info(f"Crawling events list page {page + 1}: {url}")
 
-        browser_config = BrowserConfig(
-            headless=True,
-            verbose=False,
-        )
-
-        crawler_config = CrawlerRunConfig(
-            wait_until="networkidle",
-            page_timeout=30000,
-        )
+        result = await self._crawl_url(url, page_timeout=30000)
 
-        async with AsyncWebCrawler(config=browser_config) as crawler:
-            result = await crawler.arun(url, config=crawler_config)
-
-            if not result.success:
-                logger.error(f"Failed to crawl {url}: {result.error}")
-                return ""
+        if not result.success:
+            logger.error(f"Failed to crawl {url}: {result.error}")
+            return ""
 
-            logger.info(f"Crawled {len(result.html)} characters from events list")
-            return result.html
+        logger.info(f"Crawled {len(result.html)} characters from events list")
+        return result.html
 
     async def crawl_event_detail(self, event_url: str) -> dict:
         """Crawl an individual event detail page to get the 'Visit Website' URL."""
         logger.info(f"Crawling event detail: {event_url}")
 
-        browser_config = BrowserConfig(
-            headless=True,
-            verbose=False,
-        )
-
-        crawler_config = CrawlerRunConfig(
-            wait_until="networkidle",
-            page_timeout=20000,
-        )
-
         try:
-            async with AsyncWebCrawler(config=browser_config) as crawler:
-                result = await crawler.arun(event_url, config=crawler_config)
+            result = await self._crawl_url(event_url, page_timeout=20000)
 
-                if not result.success:
-                    logger.warning(f"Failed to crawl event detail {event_url}: {result.error}")
-                    return {"source_url": event_url}
+            if not result.success:
+                logger.warning(f"Failed to crawl event detail {event_url}: {result.error}")
+                return {"source_url": event_url}
 
-                html = result.html
+            html = result.html
 
-                # Extract "Visit Website" URL using multiple patterns
-                visit_website_url = self._extract_visit_website_url(html, event_url)
+            # Extract "Visit Website" URL using multiple patterns
+            visit_website_url = self._extract_visit_website_url(html, event_url)
 
-                return {
-                    "source_url": visit_website_url or event_url,
-                    "html": html
-                }
+            return {
+                "source_url": visit_website_url or event_url,
+                "html": html
+            }
         except Exception as e:
             logger.error(f"Error crawling event detail {event_url}: {e}")
             return {"source_url": event_url}
@@ -205,15 +500,75 @@ class CatchDesMoinesCrawler:
         logger.warning(f"No Visit Website URL found, using fallback: {fallback_url}")
         return None
 
+    def _clean_html(self, html: str) -> str:
+        """Strip scripts and styles and limit size before sending HTML to Claude."""
+        clean_html = re.sub(r'<script[^>]*>[\s\S]*?</script>', '', html, flags=re.IGNORECASE)
+        clean_html = re.sub(r'<style[^>]*>[\s\S]*?</style>', '', clean_html, flags=re.IGNORECASE)
+        return clean_html[:50000]  # Limit to 50k chars
+
+    def _extraction_rules(self, today: str) -> str:
+        """Extraction rules for the packed prompt, matching the single-page prompt."""
+        return f"""CRITICAL EXTRACTION RULES:
+
+1. FIND ALL EVENTS - Look for:
+   - Event titles/names
+   - Event cards, articles, list items
+   - Links to event detail pages (format: /event/event-name/12345/)
+
+2. DATE FORMAT - All dates must be in Central Time:
+   - Format: YYYY-MM-DD HH:MM:SS
+   - Default to 19:00:00 (7 PM) if no time specified
+   - Only include FUTURE events (on or after {today})
+
+3. EXTRACT the event detail URL path (e.g., /event/chef-georges-steak-bar/53924/)
+   - This is CRITICAL for fetching the actual source URL later
+
+For EACH event, extract:
+- title: Event name
+- description: Brief description
+- date: YYYY-MM-DD HH:MM:SS (Central Time)
+- location: City/venue (default: "Des Moines, IA")
+- venue: Specific venue name
+- category: Music/Sports/Arts/Community/Entertainment/Festival/Food
+- price: Price or "See website"
+- detail_url: The event detail page path (e.g., /event/event-name/12345/)
+
+EVENT JSON FORMAT:
+  {{
+    "title": "Event Name",
+    "description": "Event details",
+    "date": "2025-MM-DD HH:MM:SS",
+    "location": "Des Moines, IA",
+    "venue": "Venue Name",
+    "category": "Category",
+    "price": "Price",
+    "detail_url": "/event/event-name/12345/"
+  }}"""
+
+    def _parse_events_json(self, response_text: str) -> Optional[list]:
+        """Parse a JSON array of events from Claude output, or None if invalid."""
+        json_match = re.search(r'\[[\s\S]*\]', response_text)
+        if not json_match:
+            logger.error(f"No JSON array found in Claude response")
+            return None
+
+        try:
+            events = json.loads(json_match.group())
+        except json.JSONDecodeError as e:
+            logger.error(f"JSON parse error: {e}")
+            return None
+
+        if not isinstance(events, list):
+            logger.error(f"Parsed data is not a list: {type(events)}")
+            return None
+
+        return events
+
     async def extract_events_with_claude(self, html: str, page_url: str) -> list:
         """Use Claude 4.5 Sonnet to extract events from HTML."""
         logger.info(f"Extracting events from {page_url} using Claude {CLAUDE_MODEL}")
 
-        # Clean HTML for Claude (limit size)
-        clean_html = re.sub(r'<script[^>]*>[\s\S]*?</script>', '', html, flags=re.IGNORECASE)
-        clean_html = re.sub(r'<style[^>]*>[\s\S]*?</style>', '', clean_html, flags=re.IGNORECASE)
-        clean_html = clean_html[:50000]  # Limit to 50k chars
-
+        clean_html = self._clean_html(html)
         today = datetime.now(CENTRAL_TZ).strftime("%Y-%m-%d")
 
         prompt = f"""You are an expert at extracting event information from CatchDesMoines.com.
@@ -265,7 +620,10 @@ FORMAT AS JSON ARRAY ONLY:
 Return ONLY the JSON array. No other text."""
 
         try:
-            message = self.anthropic_client.messages.create(
+            # Run the blocking SDK call off the event loop so concurrent
+            # extractions (and the daemon's health endpoint) keep running
+            message = await _to_daemon_thread(
+                self.anthropic_client.messages.create,
                 model=CLAUDE_MODEL,
                 max_tokens=8000,
                 temperature=0.1,
@@ -274,30 +632,122 @@ Return ONLY the JSON array. No other text."""
                 ]
             )
 
-            response_text = message.content[0].text.strip()
-
-            # Extract JSON array from response
-            json_match = re.search(r'\[[\s\S]*\]', response_text)
-            if not json_match:
-                logger.error(f"No JSON array found in Claude response")
-                return []
-
-            events = json.loads(json_match.group())
-
-            if not isinstance(events, list):
-                logger.error(f"Parsed data is not a list: {type(events)}")
+            events = self._parse_events_json(message.content[0].text.strip())
+            if events is None:
                 return []
 
             logger.info(f"Claude extracted {len(events)} events")
             return events
 
-        except json.JSONDecodeError as e:
-            logger.error(f"JSON parse error: {e}")
-            return []
         except Exception as e:
             logger.error(f"Claude API error: {e}")
             return []
 
+    def _expected_output_tokens(self, html: str) -> int:
+        """Estimate the output tokens Claude needs for a page from its event detail links."""
+        event_ids = set(re.findall(r'/event/[^"\'\s<>]+?/(\d+)/?["\']', html))
+        if not event_ids:
+            return PACK_UNKNOWN_PAGE_OUTPUT_TOKENS
+        return len(event_ids) * PACK_OUTPUT_TOKENS_PER_EVENT + PACK_OUTPUT_TOKENS_PER_PAGE_TAG
+
+    def _pack_pages(self, pages: list) -> list:
+        """
+        Group (page, html) pairs into batches for packed requests.
+
+        A batch is cut when the next page would exceed the input-token budget
+        or when the expected output of its pages would not fit in
+        PACK_MAX_OUTPUT_TOKENS, so the last page in a batch isn't truncated.
+        """
+        today = datetime.now(CENTRAL_TZ).strftime("%Y-%m-%d")
+        overhead = len(self._extraction_rules(today)) // PACK_CHARS_PER_TOKEN + 200
+
+        batches = []
+        batch: list = []
+        batch_tokens = overhead
+        batch_output = 0
+        for page, html in pages:
+            page_tokens = len(html) // PACK_CHARS_PER_TOKEN
+            page_output = self._expected_output_tokens(html)
+            if batch and (batch_tokens + page_tokens > self.pack_tokens
+                          or batch_output + page_output > PACK_MAX_OUTPUT_TOKENS):
+                batches.append(batch)
+                batch = []
+                batch_tokens = overhead
+                batch_output = 0
+            batch.append((page, html))
+            batch_tokens += page_tokens
+            batch_output += page_output
+
+        if batch:
+            batches.append(batch)
+        return batches
+
+    async def extract_packed_events_with_claude(self, batch: list) -> dict:
+        """
+        Extract events from several listing pages in one Claude request.
+
+        Each page is wrapped in a <page id="N"> tag and Claude answers with one
+        <page_events id="N"> JSON array per page. Pages missing from the
+        response, or the whole batch on API errors, fall back to single-page
+        extraction. Returns a dict mapping page number to its events.
+        """
+        page_numbers = [page for page, _ in batch]
+        logger.info(f"Extracting events from pages {[p + 1 for p in page_numbers]} in one packed request")
+
+        today = datetime.now(CENTRAL_TZ).strftime("%Y-%m-%d")
+        page_blocks = "\n\n".join(
+            f'<page id="{page}">\n{html}\n</page>' for page, html in batch
+        )
+
+        prompt = f"""You are an expert at extracting event information from CatchDesMoines.com.
+Below are {len(batch)} event listing pages, each wrapped in a <page id="N"> tag.
+Your task is to find EVERY EVENT on EACH page.
+
+CURRENT DATE: {today}
+WEBSITE CONTENT:
+{page_blocks}
+
+{self._extraction_rules(today)}
+
+OUTPUT FORMAT - For EACH page, output a JSON array of its events wrapped in a
+tag with the same id, even if the array is empty:
+<page_events id="N">[ ...events from page N... ]</page_events>
+
+Return ONLY the <page_events> blocks. No other text."""
+
+        results = {}
+        try:
+            message = await _to_daemon_thread(
+                self.anthropic_client.messages.create,
+                model=CLAUDE_MODEL,
+                max_tokens=PACK_MAX_OUTPUT_TOKENS,
+                temperature=0.1,
+                messages=[
+                    {"role": "user", "content": prompt}
+                ]
+            )
+
+            response_text = message.content[0].text
+            for match in re.finditer(r'<page_events id="(\d+)">([\s\S]*?)</page_events>', response_text):
+                page = int(match.group(1))
+                if page not in page_numbers:
+                    continue
+                events = self._parse_events_json(match.group(2))
+                if events is not None:
+                    results[page] = events
+
+        except Exception as e:
+            logger.error(f"Claude API error in packed request: {e}")
+
+        for page, html in batch:
+            if page not in results:
+                logger.warning(f"No parseable output for page {page + 1} in packed request, retrying alone")
+                results[page] = await self.extract_events_with_claude(html, f"{EVENTS_LIST_URL}?page={page}")
+            else:
+                logger.info(f"Claude extracted {len(results[page])} events from page {page + 1}")
+
+        return results
+
     def _parse_event_datetime(self, date_str: str) -> Optional[datetime]:
         """Parse event datetime string to UTC datetime."""
         if not date_str:
@@ -323,91 +773,279 @@ Return ONLY the JSON array. No other text."""
             logger.warning(f"Could not parse date '{date_str}': {e}")
             return None
 
-    async def _check_duplicate(self, event: dict) -> bool:
-        """Check if event already exists in database."""
+    def _event_local_date(self, date_str: str) -> Optional[date]:
+        """Central Time calendar date of an extracted event, or None."""
+        parsed_dt = self._parse_event_datetime(date_str)
+        if not parsed_dt:
+            return None
+        return parsed_dt.astimezone(CENTRAL_TZ).date()
+
+    async def _build_dedup_index(self):
+        """Load upcoming events from the database into the near-duplicate index."""
+        if not self.supabase:
+            if self.dry_run:
+                logger.info("Dry run: near-duplicate index only covers events from this run")
+            return
+
+        # Paging through the events table blocks, so build the new index in a
+        # worker thread and swap it in when complete
+        started = time.perf_counter()
+        self.dedup_index = await _to_daemon_thread(self._load_dedup_index)
+        elapsed = time.perf_counter() - started
+        logger.info(f"Indexed {len(self.dedup_index)} upcoming events for near-duplicate detection in {elapsed:.2f}s")
+
+    def _load_dedup_index(self) -> NearDuplicateIndex:
+        """Page through upcoming events in the database and index them."""
+        index = NearDuplicateIndex()
+        since = datetime.now(ZoneInfo("UTC")) - timedelta(days=DEDUP_DATE_WINDOW_DAYS)
+        offset = 0
+
+        try:
+            while True:
+                result = self.supabase.table("events").select(
+                    "id, title, venue, date"
+                ).gte(
+                    "date", since.isoformat()
+                ).order("id").range(offset, offset + DEDUP_PAGE_SIZE - 1).execute()
+
+                for row in result.data:
+                    if not row.get("date"):
+                        continue
+                    event_date = date_parser.isoparse(row["date"]).astimezone(CENTRAL_TZ).date()
+                    index.add(
+                        row.get("title") or "",
+                        row.get("venue") or "",
+                        event_date,
+                        label=f"{row.get('title')} (id {row.get('id')})",
+                        ref=row.get("id"),
+                    )
+
+                if len(result.data) < DEDUP_PAGE_SIZE:
+                    break
+                offset += DEDUP_PAGE_SIZE
+
+        except Exception as e:
+            logger.warning(f"Error loading events for near-duplicate index: {e}")
+
+        return index
+
+    async def _find_existing(self, event: dict) -> Optional[dict]:
+        """
+        Find an existing event matching this one.
+
+        Returns a dict with the row "id" (None for events only known from
+        this dry run), its Central Time "date" and a "label" for logging, or
+        None if there is no match. Matches are fuzzy and may be on a nearby
+        day, so they must not be treated as the same occurrence on their own.
+        """
+        event_date = self._event_local_date(event.get("date", ""))
+        if event_date:
+            match = self.dedup_index.find_entry(event.get("title", ""), event.get("venue", ""), event_date)
+            if match:
+                logger.info(f"Near-duplicate of existing event: {match['label']}")
+                return {"id": match["ref"], "label": match["label"], "date": match["date"]}
+
         if self.dry_run or not self.supabase:
-            return False
+            return None
 
         try:
             # Query for existing event with same title and venue
-            result = self.supabase.table("events").select("id").ilike(
+            query = self.supabase.table("events").select("id, date").ilike(
                 "title", event.get("title", "").strip()
             ).ilike(
                 "venue", event.get("venue", "").strip()
-            ).execute()
+            )
+            result = await asyncio.to_thread(query.execute)
 
-            return len(result.data) > 0
+            if result.data:
+                row = result.data[0]
+                row_date = date_parser.isoparse(row["date"]).astimezone(CENTRAL_TZ).date() if row.get("date") else None
+                return {"id": row.get("id"), "label": event.get("title"), "date": row_date}
+            return None
 
         except Exception as e:
             logger.warning(f"Error checking duplicate: {e}")
-            return False
+            return None
+
+    def _event_fields(self, event: dict, parsed_dt: datetime) -> dict:
+        """Database columns taken from the extracted listing data."""
+        return {
+            "title": event.get("title", "Untitled Event")[:200],
+            "original_description": event.get("description", "")[:500],
+            "date": parsed_dt.isoformat(),
+            "event_start_local": event.get("date", ""),
+            "event_timezone": "America/Chicago",
+            "event_start_utc": parsed_dt.isoformat(),
+            "location": event.get("location", "Des Moines, IA")[:100],
+            "venue": event.get("venue", event.get("location", "TBD"))[:100],
+            "category": event.get("category", "General")[:50],
+            "price": event.get("price", "See website")[:50],
+            "source_url": event.get("source_url", ""),
+        }
+
+    def _upcoming_datetime(self, event: dict) -> Optional[datetime]:
+        """Parsed UTC start time, or None (logged) for invalid or past dates."""
+        parsed_dt = self._parse_event_datetime(event.get("date", ""))
+        if not parsed_dt:
+            logger.warning(f"Skipping event with invalid date: {event.get('title')}")
+            return None
+
+        # Skip past events
+        if parsed_dt < datetime.now(ZoneInfo("UTC")):
+            logger.info(f"Skipping past event: {event.get('title')}")
+            return None
+
+        return parsed_dt
+
+    async def _insert_event(self, event: dict) -> str:
+        """
+        Insert event into Supabase.
 
-    async def _insert_event(self, event: dict) -> bool:
-        """Insert event into Supabase."""
+        Returns INSERTED (and sets event["row_id"]), SKIPPED for invalid or
+        past dates, or FAILED when the insert should be retried later.
+        """
         if self.dry_run:
             logger.info(f"[DRY RUN] Would insert: {event.get('title')}")
-            return True
+            return INSERTED
 
         if not self.supabase:
             logger.error("Supabase client not initialized")
-            return False
+            return FAILED
 
         try:
-            # Parse datetime
-            parsed_dt = self._parse_event_datetime(event.get("date", ""))
+            parsed_dt = self._upcoming_datetime(event)
             if not parsed_dt:
-                logger.warning(f"Skipping event with invalid date: {event.get('title')}")
-                return False
-
-            # Skip past events
-            if parsed_dt < datetime.now(ZoneInfo("UTC")):
-                logger.info(f"Skipping past event: {event.get('title')}")
-                return False
+                return SKIPPED
 
             # Build event record
             now = datetime.now(ZoneInfo("UTC")).isoformat()
             event_record = {
-                "title": event.get("title", "Untitled Event")[:200],
-                "original_description": event.get("description", "")[:500],
+                **self._event_fields(event, parsed_dt),
                 "enhanced_description": event.get("description", "")[:500],
-                "date": parsed_dt.isoformat(),
-                "event_start_local": event.get("date", ""),
-                "event_timezone": "America/Chicago",
-                "event_start_utc": parsed_dt.isoformat(),
-                "location": event.get("location", "Des Moines, IA")[:100],
-                "venue": event.get("venue", event.get("location", "TBD"))[:100],
-                "category": event.get("category", "General")[:50],
-                "price": event.get("price", "See website")[:50],
-                "source_url": event.get("source_url", ""),
                 "is_featured": False,
                 "is_enhanced": False,
                 "created_at": now,
                 "updated_at": now,
             }
 
-            result = self.supabase.table("events").insert(event_record).execute()
+            result = await asyncio.to_thread(self.supabase.table("events").insert(event_record).execute)
 
             if result.data:
                 logger.info(f"Inserted event: {event.get('title')}")
-                return True
+                event["row_id"] = result.data[0].get("id")
+                return INSERTED
             else:
                 logger.error(f"Failed to insert event: {event.get('title')}")
-                return False
+                return FAILED
 
         except Exception as e:
             logger.error(f"Error inserting event '{event.get('title')}': {e}")
-            return False
+            return FAILED
 
-    async def run(self):
-        """Run the crawler."""
-        logger.info("=" * 60)
-        logger.info("CatchDesMoines Event Crawler")
-        logger.info(f"Dry Run: {self.dry_run}")
-        logger.info(f"Max Pages: {self.max_pages}")
-        logger.info("=" * 60)
+    async def _update_event(self, row_id, event: dict) -> str:
+        """
+        Update an existing event row from a changed listing card.
 
-        # Initialize clients
-        self._init_clients()
+        Featured/enhanced flags and the enhanced description are left alone.
+        Returns UPDATED, SKIPPED for invalid or past dates, or FAILED.
+        """
+        if self.dry_run:
+            logger.info(f"[DRY RUN] Would update event {row_id}: {event.get('title')}")
+            return UPDATED
+
+        if not self.supabase:
+            logger.error("Supabase client not initialized")
+            return FAILED
+
+        try:
+            parsed_dt = self._upcoming_datetime(event)
+            if not parsed_dt:
+                return SKIPPED
+
+            event_record = {
+                **self._event_fields(event, parsed_dt),
+                "updated_at": datetime.now(ZoneInfo("UTC")).isoformat(),
+            }
+
+            query = self.supabase.table("events").update(event_record).eq("id", row_id)
+            result = await asyncio.to_thread(query.execute)
+
+            if result.data:
+                logger.info(f"Updated event {row_id}: {event.get('title')}")
+                event["row_id"] = row_id
+                return UPDATED
+            else:
+                logger.error(f"Failed to update event {row_id}: {event.get('title')}")
+                return FAILED
+
+        except Exception as e:
+            logger.error(f"Error updating event '{event.get('title')}': {e}")
+            return FAILED
+
+    async def _extract_listing_pages_packed(self) -> Optional[list]:
+        """
+        Crawl all listing pages, then extract them in packed Claude requests.
+
+        Returns the events in page order up to the first page without events,
+        matching the sequential mode, or None if the first page failed.
+        """
+        pages = []
+        for page in range(self.max_pages):
+            html = await self.crawl_events_list(page)
+
+            if not html:
+                logger.warning(f"No HTML returned for page {page + 1}")
+                if page == 0:
+                    logger.error("First page failed, aborting")
+                    return None
+                break
+
+            pages.append((page, self._clean_html(html)))
+
+            # Small delay between pages
+            if page < self.max_pages - 1:
+                await asyncio.sleep(2)
+
+        # Reuse events from listing pages unchanged since the last poll
+        page_events = {}
+        uncached = []
+        for page, clean_html in pages:
+            events = self._cached_page_events(page, clean_html)
+            if events is None:
+                uncached.append((page, clean_html))
+            else:
+                page_events[page] = events
+
+        batches = self._pack_pages(uncached)
+        logger.info(f"Packed {len(uncached)} pages into {len(batches)} Claude requests "
+                    f"(budget {self.pack_tokens} input tokens)")
+
+        semaphore = asyncio.Semaphore(self.pack_concurrency)
+
+        async def extract(batch):
+            async with semaphore:
+                return await self.extract_packed_events_with_claude(batch)
+
+        for results in await asyncio.gather(*(extract(batch) for batch in batches)):
+            page_events.update(results)
+
+        for page, clean_html in uncached:
+            self._cache_page_events(page, clean_html, page_events.get(page) or [])
+
+        all_events = []
+        for page, _ in pages:
+            events = page_events.get(page) or []
+            if not events:
+                logger.info(f"No more events found on page {page + 1}")
+                break
+            all_events.extend(events)
+
+        return all_events
+
+    async def _extract_listing_events(self) -> Optional[list]:
+        """Crawl listing pages and extract their events, or None if the first page failed."""
+        if self.pack_tokens:
+            return await self._extract_listing_pages_packed()
 
         all_events = []
 
@@ -419,11 +1057,15 @@ Return ONLY the JSON array. No other text."""
                 logger.warning(f"No HTML returned for page {page + 1}")
                 if page == 0:
                     logger.error("First page failed, aborting")
-                    return
+                    return None
                 break
 
-            # Extract events using Claude
-            events = await self.extract_events_with_claude(html, f"{EVENTS_LIST_URL}?page={page}")
+            # Extract events using Claude, unless the page is unchanged since the last poll
+            clean_html = self._clean_html(html)
+            events = self._cached_page_events(page, clean_html)
+            if events is None:
+                events = await self.extract_events_with_claude(clean_html, f"{EVENTS_LIST_URL}?page={page}")
+                self._cache_page_events(page, clean_html, events)
 
             if not events:
                 logger.info(f"No more events found on page {page + 1}")
@@ -436,38 +1078,90 @@ Return ONLY the JSON array. No other text."""
             if page < self.max_pages - 1:
                 await asyncio.sleep(2)
 
-        logger.info(f"Extracted {len(all_events)} total events from {self.max_pages} pages")
+        return all_events
 
-        # Process each event
-        for i, event in enumerate(all_events):
-            logger.info(f"Processing event {i + 1}/{len(all_events)}: {event.get('title')}")
+    async def _process_event(self, event: dict, update_row_id=None) -> bool:
+        """
+        Deduplicate, resolve the source URL and insert one event.
 
+        With update_row_id, the existing row is updated instead. Returns False
+        only when the event should be retried later; duplicates and events
+        skipped on purpose (invalid or past dates) count as handled.
+        """
+        if update_row_id is None:
             # Check for duplicates
-            is_duplicate = await self._check_duplicate(event)
-            if is_duplicate:
+            existing = await self._find_existing(event)
+            if existing:
                 logger.info(f"Skipping duplicate: {event.get('title')}")
                 self.duplicates_skipped += 1
-                continue
+                # Only adopt the matched row as this event's own when it is on
+                # the same day; recurring events share a title and venue on
+                # nearby days, and a later update must not move another occurrence
+                if existing["date"] == self._event_local_date(event.get("date", "")):
+                    event["row_id"] = existing["id"]
+                return True
 
-            # Get source URL from event detail page
-            detail_url = event.get("detail_url")
-            if detail_url and not detail_url.startswith("http"):
-                detail_url = f"{CATCHDESMOINES_BASE_URL}{detail_url}"
+        # Get source URL from event detail page
+        detail_url = event.get("detail_url")
+        if detail_url and not detail_url.startswith("http"):
+            detail_url = f"{CATCHDESMOINES_BASE_URL}{detail_url}"
+
+        if detail_url:
+            detail_result = await self.crawl_event_detail(detail_url)
+            event["source_url"] = detail_result.get("source_url", detail_url)
+
+            # Small delay between detail page requests
+            await asyncio.sleep(1)
+        else:
+            event["source_url"] = EVENTS_LIST_URL
+
+        if update_row_id is not None:
+            status = await self._update_event(update_row_id, event)
+            if status == UPDATED:
+                self.events_updated += 1
+        else:
+            status = await self._insert_event(event)
+            if status == INSERTED:
+                self.events_inserted += 1
+                self.events_found.append(event)
 
-            if detail_url:
-                detail_result = await self.crawl_event_detail(detail_url)
-                event["source_url"] = detail_result.get("source_url", detail_url)
+        if status in (INSERTED, UPDATED):
+            # Catch repeats of this event later in the same run
+            event_date = self._event_local_date(event.get("date", ""))
+            if event_date:
+                self.dedup_index.add(
+                    event.get("title", ""), event.get("venue", ""), event_date, ref=event.get("row_id")
+                )
 
-                # Small delay between detail page requests
-                await asyncio.sleep(1)
-            else:
-                event["source_url"] = EVENTS_LIST_URL
+        return status != FAILED
 
-            # Insert event
-            success = await self._insert_event(event)
-            if success:
-                self.events_inserted += 1
-                self.events_found.append(event)
+    async def _process_events(self, events: list):
+        """Deduplicate, resolve source URLs and insert extracted events."""
+        for i, event in enumerate(events):
+            logger.info(f"Processing event {i + 1}/{len(events)}: {event.get('title')}")
+            await self._process_event(event)
+
+    async def run(self):
+        """Run the crawler."""
+        logger.info("=" * 60)
+        logger.info("CatchDesMoines Event Crawler")
+        logger.info(f"Dry Run: {self.dry_run}")
+        logger.info(f"Max Pages: {self.max_pages}")
+        logger.info(f"Pack Tokens: {self.pack_tokens or 'disabled'}")
+        logger.info("=" * 60)
+
+        # Initialize clients
+        self._init_clients()
+        await self._build_dedup_index()
+
+        all_events = await self._extract_listing_events()
+        if all_events is None:
+            return
+
+        logger.info(f"Extracted {len(all_events)} total events from {self.max_pages} pages")
+
+        # Process each event
+        await self._process_events(all_events)
 
         # Summary
         logger.info("=" * 60)
@@ -484,6 +1178,276 @@ Return ONLY the JSON array. No other text."""
             "duplicates": self.duplicates_skipped,
         }
 
+    # ------------------------------------------------------------------
+    # Daemon mode
+    # ------------------------------------------------------------------
+
+    def _cached_page_events(self, page: int, clean_html: str) -> Optional[list]:
+        """Events extracted from an identical listing page on a previous poll, or None."""
+        cached = self.page_cache.get(page)
+        if cached and cached[0] == _content_hash(clean_html):
+            logger.info(f"Listing page {page + 1} unchanged, reusing {len(cached[1])} extracted events")
+            self.stats["page_cache_hits"] += 1
+            return cached[1]
+        return None
+
+    def _cache_page_events(self, page: int, clean_html: str, events: list):
+        """Remember the events extracted from a listing page."""
+        # Empty results may be extraction failures, so always retry those
+        if events:
+            self.page_cache[page] = (_content_hash(clean_html), events)
+        else:
+            self.page_cache.pop(page, None)
+
+    def _event_key(self, event: dict) -> str:
+        """Stable id for a listing card: the detail page id, else title and date."""
+        match = re.search(r'/(\d+)/?$', event.get("detail_url") or "")
+        if match:
+            return match.group(1)
+        return f"{_normalize_text(event.get('title', ''))}|{event.get('date', '')}"
+
+    def _card_hash(self, event: dict) -> str:
+        """Content hash of the listing card fields Claude copies rather than writes.
+
+        Description, category and price are generated and can be reworded from
+        one extraction to the next, so they are left out to avoid false changes.
+        """
+        card = [
+            _normalize_text(event.get("title", "")),
+            event.get("date") or "",
+            _normalize_text(event.get("venue", "")),
+            event.get("detail_url") or "",
+        ]
+        return _content_hash(json.dumps(card))
+
+    async def crawl_changed(self) -> dict:
+        """Poll listing pages and process only events whose listing card changed."""
+        started = time.perf_counter()
+
+        if time.time() - self.index_built_at > DAEMON_INDEX_REFRESH_SECONDS:
+            await self._build_dedup_index()
+            self.index_built_at = time.time()
+
+        all_events = await self._extract_listing_events()
+        if all_events is None:
+            raise RuntimeError("First listing page failed")
+
+        changed = []
+        for event in all_events:
+            tracked = self.tracked_cards.get(self._event_key(event))
+            if not tracked or tracked["hash"] != self._card_hash(event):
+                changed.append(event)
+
+        logger.info(f"{len(changed)} of {len(all_events)} listing cards are new or changed")
+
+        inserted_before = self.events_inserted
+        updated_before = self.events_updated
+        duplicates_before = self.duplicates_skipped
+        failed = 0
+
+        for event in changed:
+            key = self._event_key(event)
+            tracked = self.tracked_cards.get(key)
+
+            # A changed card updates a row only if the card inserted it or
+            # matched it on the same day; otherwise it goes through the usual
+            # insert/skip path
+            row_id = None
+            if tracked:
+                row_id = tracked.get("row_id")
+                if row_id is None:
+                    existing = await self._find_existing(event)
+                    if existing and existing["date"] == self._event_local_date(event.get("date", "")):
+                        row_id = existing["id"]
+
+            handled = await self._process_event(event, update_row_id=row_id)
+
+            # Card state is recorded only once an event has been handled, so
+            # failed inserts and interrupted polls are retried next time
+            if handled:
+                event_date = self._event_local_date(event.get("date", ""))
+                self.tracked_cards.pop(key, None)  # Re-insert so the dict stays oldest-first
+                self.tracked_cards[key] = {
+                    "hash": self._card_hash(event),
+                    "row_id": event.get("row_id", row_id),
+                    "date": event_date,
+                }
+            else:
+                failed += 1
+
+        self._prune_daemon_state()
+
+        self.stats["events_extracted"] += len(all_events)
+        self.stats["events_changed"] += len(changed)
+
+        return {
+            "total_found": len(all_events),
+            "changed": len(changed),
+            "inserted": self.events_inserted - inserted_before,
+            "updated": self.events_updated - updated_before,
+            "duplicates": self.duplicates_skipped - duplicates_before,
+            "failed": failed,
+            "duration": time.perf_counter() - started,
+        }
+
+    def _prune_daemon_state(self):
+        """Forget past events and cap per-event state so a long-running daemon stays bounded."""
+        yesterday = datetime.now(CENTRAL_TZ).date() - timedelta(days=1)
+        for key in [key for key, card in self.tracked_cards.items() if card["date"] and card["date"] < yesterday]:
+            del self.tracked_cards[key]
+
+        # Cards without a parseable date are never pruned above, so also cap the size
+        for key in list(self.tracked_cards)[:max(0, len(self.tracked_cards) - DAEMON_MAX_TRACKED_CARDS)]:
+            del self.tracked_cards[key]
+
+        del self.events_found[:-DAEMON_MAX_RECENT_EVENTS]
+
+    async def run_daemon(
+        self,
+        interval: int = DAEMON_INTERVAL_SECONDS,
+        health_host: str = "127.0.0.1",
+        health_port: int = DAEMON_HEALTH_PORT,
+    ):
+        """
+        Poll listing pages every `interval` seconds until SIGINT/SIGTERM.
+
+        Clients, the browser and the near-duplicate index stay warm between
+        polls. Health and metrics are served on health_host:health_port.
+        """
+        logger.info("=" * 60)
+        logger.info("CatchDesMoines Event Crawler (daemon)")
+        logger.info(f"Dry Run: {self.dry_run}")
+        logger.info(f"Max Pages: {self.max_pages}")
+        logger.info(f"Pack Tokens: {self.pack_tokens or 'disabled'}")
+        logger.info(f"Interval: {interval}s")
+        logger.info("=" * 60)
+
+        self.poll_interval = interval
+        self._init_clients()
+        await self._build_dedup_index()
+        self.index_built_at = time.time()
+        await self.start_browser()
+
+        stop = asyncio.Event()
+        poll: Optional[asyncio.Task] = None
+
+        def request_stop():
+            # Abandon the running poll so shutdown fits in the container's
+            # stop timeout; events it didn't finish are retried next start
+            stop.set()
+            if poll and not poll.done():
+                poll.cancel()
+
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, request_stop)
+
+        server = await asyncio.start_server(self._handle_health_request, health_host, health_port)
+        logger.info(f"Health endpoint listening on http://{health_host}:{health_port}/health")
+
+        try:
+            while not stop.is_set():
+                self.stats["polls"] += 1
+                poll = asyncio.create_task(self.crawl_changed())
+                try:
+                    result = await poll
+                    self.stats["last_success_at"] = time.time()
+                    self.stats["last_poll_duration"] = result["duration"]
+                    logger.info(
+                        f"Poll complete in {result['duration']:.1f}s: {result['changed']} changed, "
+                        f"{result['inserted']} inserted, {result['updated']} updated, "
+                        f"{result['duplicates']} duplicates, {result['failed']} to retry"
+                    )
+                except asyncio.CancelledError:
+                    if not stop.is_set():
+                        raise
+                    logger.info("Poll cancelled for shutdown")
+                    break
+                except Exception as e:
+                    self.stats["poll_failures"] += 1
+                    logger.error(f"Poll failed: {e}")
+
+                try:
+                    await asyncio.wait_for(stop.wait(), timeout=interval)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            logger.info("Shutting down daemon")
+            server.close()
+            await server.wait_closed()
+            await self.close_browser()
+
+    def _health(self) -> tuple:
+        """HTTP status and JSON body for the health endpoint."""
+        now = time.time()
+        last_success = self.stats["last_success_at"]
+        stale_after = DAEMON_STALE_INTERVALS * self.poll_interval
+        healthy = (now - (last_success or self.stats["started_at"])) < stale_after
+
+        body = {
+            "status": "ok" if healthy else "stale",
+            "uptime_seconds": round(now - self.stats["started_at"]),
+            "last_success_at": datetime.fromtimestamp(last_success, ZoneInfo("UTC")).isoformat() if last_success else None,
+            "polls": self.stats["polls"],
+            "poll_failures": self.stats["poll_failures"],
+            "indexed_events": len(self.dedup_index),
+            "tracked_events": len(self.tracked_cards),
+        }
+        return (200 if healthy else 503), json.dumps(body)
+
+    def _metrics(self) -> str:
+        """Prometheus text exposition of daemon counters."""
+        metrics = {
+            "crawler_uptime_seconds": time.time() - self.stats["started_at"],
+            "crawler_polls_total": self.stats["polls"],
+            "crawler_poll_failures_total": self.stats["poll_failures"],
+            "crawler_last_success_timestamp_seconds": self.stats["last_success_at"] or 0,
+            "crawler_last_poll_duration_seconds": self.stats["last_poll_duration"],
+            "crawler_page_cache_hits_total": self.stats["page_cache_hits"],
+            "crawler_events_extracted_total": self.stats["events_extracted"],
+            "crawler_events_changed_total": self.stats["events_changed"],
+            "crawler_events_inserted_total": self.events_inserted,
+            "crawler_events_updated_total": self.events_updated,
+            "crawler_duplicates_skipped_total": self.duplicates_skipped,
+            "crawler_indexed_events": len(self.dedup_index),
+            "crawler_tracked_events": len(self.tracked_cards),
+        }
+        return "".join(f"{name} {value}\n" for name, value in metrics.items())
+
+    async def _handle_health_request(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serve GET /health and GET /metrics."""
+        try:
+            request_line = await asyncio.wait_for(reader.readline(), timeout=5)
+            while (await asyncio.wait_for(reader.readline(), timeout=5)) not in (b"\r\n", b"\n", b""):
+                pass  # Skip headers
+
+            parts = request_line.decode("latin-1").split()
+            path = parts[1].split("?")[0] if len(parts) > 1 else ""
+
+            if path == "/health":
+                status, body = self._health()
+                content_type = "application/json"
+            elif path == "/metrics":
+                status, body = 200, self._metrics()
+                content_type = "text/plain; version=0.0.4"
+            else:
+                status, body = 404, "Not Found\n"
+                content_type = "text/plain"
+
+            reason = {200: "OK", 404: "Not Found", 503: "Service Unavailable"}[status]
+            payload = body.encode()
+            writer.write(
+                f"HTTP/1.1 {status} {reason}\r\n"
+                f"Content-Type: {content_type}\r\n"
+                f"Content-Length: {len(payload)}\r\n"
+                f"Connection: close\r\n\r\n".encode() + payload
+            )
+            await writer.drain()
+        except Exception as e:
+            logger.warning(f"Error serving health request: {e}")
+        finally:
+            writer.close()
+
 
 async def main():
     """Main entry point."""
@@ -492,8 +1456,24 @@ async def main():
     parser = argparse.ArgumentParser(description="CatchDesMoines Event Crawler")
     parser.add_argument("--dry-run", action="store_true", help="Don't insert into database")
     parser.add_argument("--max-pages", type=int, default=5, help="Maximum pages to crawl")
+    parser.add_argument("--pack-tokens", type=int, default=0,
+                        help="Pack listing pages into Claude requests of up to N input tokens (0 = one request per page)")
+    parser.add_argument("--pack-concurrency", type=int, default=PACK_CONCURRENCY,
+                        help="Packed Claude requests to run in parallel")
+    parser.add_argument("--daemon", action="store_true",
+                        help="Keep running, inserting new events and updating changed ones on a schedule")
+    parser.add_argument("--interval", type=int, default=DAEMON_INTERVAL_SECONDS,
+                        help="Seconds between listing polls in daemon mode")
+    parser.add_argument("--health-host", default="127.0.0.1", help="Health endpoint bind address in daemon mode")
+    parser.add_argument("--health-port", type=int, default=DAEMON_HEALTH_PORT,
+                        help="Health endpoint port in daemon mode")
     args = parser.parse_args()
 
+    if args.pack_tokens < 0:
+        parser.error("--pack-tokens must be 0 (disabled) or a positive token budget")
+    if args.pack_concurrency < 1:
+        parser.error("--pack-concurrency must be at least 1")
+
     # Load environment variables from .env file if present
     try:
         from dotenv import load_dotenv
@@ -501,7 +1481,21 @@ async def main():
     except ImportError:
         pass
 
-    crawler = CatchDesMoinesCrawler(dry_run=args.dry_run, max_pages=args.max_pages)
+    crawler = CatchDesMoinesCrawler(
+        dry_run=args.dry_run,
+        max_pages=args.max_pages,
+        pack_tokens=args.pack_tokens,
+        pack_concurrency=args.pack_concurrency,
+    )
+
+    if args.daemon:
+        await crawler.run_daemon(
+            interval=args.interval,
+            health_host=args.health_host,
+            health_port=args.health_port,
+        )
+        return None
+
     result = await crawler.run()
 
     # Output for GitHub Actions
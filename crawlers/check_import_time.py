@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Import-Time Check
+=================
+
+Imports a module under `python -X importtime` and fails if it loads any of the
+heavy crawler dependencies eagerly or exceeds the cumulative import budget.
+Run by CI to keep crawler startup fast for short cron runs.
+
+Usage:
+    python check_import_time.py [MODULE] [--budget-ms N]
+"""
+
+import argparse
+import subprocess
+import sys
+
+# Dependencies that must only be imported by the stage that needs them
+HEAVY_MODULES = ("crawl4ai", "anthropic", "supabase", "playwright", "selenium")
+
+
+def measure_imports(module: str) -> dict:
+    """Return cumulative import time in microseconds per top-level import."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        print(proc.stderr, file=sys.stderr)
+        raise SystemExit(f"Importing {module} failed")
+
+    timings = {}
+    for line in proc.stderr.splitlines():
+        # Format: "import time: self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        timings[name.strip()] = int(cumulative)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check crawler import time")
+    parser.add_argument("module", nargs="?", default="catchdesmoines_crawler", help="Module to import")
+    parser.add_argument("--budget-ms", type=float, default=250, help="Maximum cumulative import time")
+    args = parser.parse_args()
+
+    timings = measure_imports(args.module)
+    total_ms = timings.get(args.module, 0) / 1000
+
+    eager = sorted(name for name in timings if name.split(".")[0] in HEAVY_MODULES)
+    slowest = sorted(timings.items(), key=lambda item: item[1], reverse=True)[:10]
+
+    print(f"{args.module}: {total_ms:.1f} ms cumulative import time (budget {args.budget_ms:.0f} ms)")
+    for name, cumulative in slowest:
+        print(f"  {cumulative / 1000:8.1f} ms  {name}")
+
+    failed = False
+    if eager:
+        print(f"::error::{args.module} eagerly imports heavy dependencies: {', '.join(eager[:5])}")
+        failed = True
+    if total_ms > args.budget_ms:
+        print(f"::error::{args.module} import time {total_ms:.1f} ms exceeds budget of {args.budget_ms:.0f} ms")
+        failed = True
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""Shared fakes for the crawler tests.
+
+The fakes stand in for the Anthropic and Supabase clients so the tests run
+with only python-dateutil and pytest installed.
+"""
+
+import asyncio
+import json
+import re
+from types import SimpleNamespace
+
+import pytest
+from dateutil import parser as date_parser
+
+from catchdesmoines_crawler import CatchDesMoinesCrawler
+
+
+class FakeAnthropic:
+    """Records messages.create calls and answers them with `respond(prompt)`."""
+
+    def __init__(self, respond):
+        self.respond = respond
+        self.calls = []
+        self.messages = self
+
+    def create(self, **kwargs):
+        prompt = kwargs["messages"][0]["content"]
+        self.calls.append({"prompt": prompt, "max_tokens": kwargs["max_tokens"]})
+        text = self.respond(prompt)
+        if isinstance(text, Exception):
+            raise text
+        return SimpleNamespace(content=[SimpleNamespace(text=text)])
+
+    @property
+    def packed_calls(self):
+        return [call for call in self.calls if "<page id=" in call["prompt"]]
+
+    @property
+    def single_calls(self):
+        return [call for call in self.calls if "<page id=" not in call["prompt"]]
+
+
+def packed_page_ids(prompt: str) -> list:
+    """Page ids in a packed prompt, in order."""
+    return [int(page) for page in re.findall(r'<page id="(\d+)">', prompt)]
+
+
+def listing_html(*event_ids) -> str:
+    """Listing page HTML with one card per event id."""
+    return "".join(
+        f'<article><a href="/event/event-{event_id}/{event_id}/">Event {event_id}</a></article>'
+        for event_id in event_ids
+    )
+
+
+@pytest.fixture
+def make_crawler():
+    """Build a crawler with fake clients and no browser or sleeps."""
+
+    def make(anthropic=None, supabase=None, **kwargs):
+        crawler = CatchDesMoinesCrawler(**kwargs)
+        crawler.anthropic_client = anthropic
+        crawler.supabase = supabase
+        return crawler
+
+    return make
+
+
+class FakeQuery:
+    """Chainable query over FakeSupabase rows, supporting the calls the crawler makes."""
+
+    def __init__(self, db, op="select", record=None):
+        self.db = db
+        self.op = op
+        self.record = record
+        self.filters = []
+        self.bounds = None
+
+    def select(self, columns):
+        return self
+
+    def insert(self, record):
+        return FakeQuery(self.db, "insert", record)
+
+    def update(self, record):
+        return FakeQuery(self.db, "update", record)
+
+    def ilike(self, column, value):
+        self.filters.append(lambda row: str(row.get(column, "")).lower() == value.lower())
+        return self
+
+    def eq(self, column, value):
+        self.filters.append(lambda row: row.get(column) == value)
+        return self
+
+    def gte(self, column, value):
+        self.filters.append(lambda row: date_parser.isoparse(row[column]) >= date_parser.isoparse(value))
+        return self
+
+    def order(self, column):
+        return self
+
+    def range(self, start, end):
+        self.bounds = (start, end + 1)
+        return self
+
+    def execute(self):
+        if self.op == "insert":
+            if self.db.fail_inserts:
+                raise ConnectionError("network down")
+            row = {**self.record, "id": len(self.db.rows) + 1}
+            self.db.rows.append(row)
+            return SimpleNamespace(data=[row])
+
+        rows = [row for row in self.db.rows if all(check(row) for check in self.filters)]
+        if self.op == "update":
+            for row in rows:
+                row.update(self.record)
+            self.db.updates.extend((row["id"], dict(self.record)) for row in rows)
+            return SimpleNamespace(data=rows)
+
+        if self.bounds:
+            rows = rows[self.bounds[0]:self.bounds[1]]
+        return SimpleNamespace(data=[dict(row) for row in rows])
+
+
+class FakeSupabase:
+    """In-memory events table."""
+
+    def __init__(self, rows=()):
+        self.rows = [dict(row, id=i + 1) for i, row in enumerate(rows)]
+        self.updates = []
+        self.fail_inserts = False
+
+    def table(self, name):
+        assert name == "events"
+        return FakeQuery(self)
+
+    def row(self, row_id):
+        return next(row for row in self.rows if row["id"] == row_id)
+
+
+class FakeSite:
+    """Listing page whose HTML changes whenever its events do, plus a Claude that extracts them."""
+
+    def __init__(self, events):
+        self.events = events
+        self.detail_crawls = []
+        self.anthropic = FakeAnthropic(lambda prompt: json.dumps(self.events))
+
+    async def crawl_events_list(self, page=0):
+        return f"<main>{json.dumps(self.events)}</main>" if page == 0 else ""
+
+    async def crawl_event_detail(self, event_url):
+        self.detail_crawls.append(event_url)
+        return {"source_url": f"https://example.com{event_url[-8:]}"}
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    """Skip the politeness delays between page and detail requests."""
+
+    async def sleep(delay, result=None):
+        return result
+
+    monkeypatch.setattr(asyncio, "sleep", sleep)
+
+
+@pytest.fixture
+def make_daemon(make_crawler, no_sleep):
+    """Build a crawler wired to a FakeSite and FakeSupabase, ready for crawl_changed()."""
+
+    def make(site, db, **kwargs):
+        crawler = make_crawler(anthropic=site.anthropic, supabase=db, max_pages=1, **kwargs)
+        crawler.crawl_events_list = site.crawl_events_list
+        crawler.crawl_event_detail = site.crawl_event_detail
+        return crawler
+
+    return make
@@ -0,0 +1,130 @@
+"""Tests for the near-duplicate index in catchdesmoines_crawler.
+
+Run with: cd crawlers && python -m pytest -q
+Include the lookup benchmark with: RUN_BENCHMARKS=1 python -m pytest -q
+"""
+
+import os
+import random
+import time
+from datetime import date, timedelta
+
+import pytest
+
+from catchdesmoines_crawler import (
+    TITLE_STOPWORDS,
+    NearDuplicateIndex,
+    _normalize_text,
+    _trigrams,
+)
+
+DAY = date(2026, 10, 24)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("The Fall Fest", "fall fest"),
+    ("Fall Fest 2026", "fall fest"),
+    ("5th Annual Fall Fest!", "5th fall fest"),
+    ("Art & Wine Walk", "art and wine walk"),
+    ("  Jazz -- in the  Gardens ", "jazz in gardens"),
+    ("", ""),
+])
+def test_normalize_title(text, expected):
+    assert _normalize_text(text, TITLE_STOPWORDS) == expected
+
+
+def test_normalize_keeps_stopwords_by_default():
+    assert _normalize_text("The Temple for Performing Arts") == "the temple for performing arts"
+
+
+def test_trigrams():
+    assert _trigrams("ab") == {" ab", "ab "}
+    assert _trigrams("") == frozenset()
+
+
+def _index(*events):
+    index = NearDuplicateIndex()
+    for title, venue, day in events:
+        index.add(title, venue, day)
+    return index
+
+
+@pytest.mark.parametrize("existing, candidate", [
+    ("The Fall Fest", "Fall Fest 2026"),
+    ("Des Moines Arts Festival", "Des Moines Arts Fest"),
+    ("Jazz in the Gardens", "Jazz in the Garden"),
+    ("Art & Wine Walk", "Art and Wine Walk"),
+])
+def test_near_duplicates_match(existing, candidate):
+    index = _index((existing, "Living History Farms", DAY))
+    assert index.find(candidate, "Living History Farms", DAY) == existing
+
+
+@pytest.mark.parametrize("existing, candidate", [
+    ("Book Club", "Kids Book Club"),
+    ("Halloween Party", "Halloween Dance Party"),
+    ("Spring Fest", "Fall Fest"),
+    ("Trivia Night", "Karaoke Night"),
+    ("Winter Ball", "Winter Ballet"),
+    ("Symphony Pop Concert", "Symphony Pops Concert"),
+    ("Fashion Run", "Fashion Runway"),
+])
+def test_distinct_events_do_not_match(existing, candidate):
+    index = _index((existing, "Central Library", DAY))
+    assert index.find(candidate, "Central Library", DAY) is None
+
+
+def test_different_venue_does_not_match():
+    index = _index(("Fall Fest", "Living History Farms", DAY))
+    assert index.find("Fall Fest", "Wells Fargo Arena", DAY) is None
+
+
+def test_venue_variant_matches():
+    index = _index(("Fall Fest", "Living History Farms", DAY))
+    assert index.find("Fall Fest", "Living History Farms, Urbandale", DAY) == "Fall Fest"
+
+
+@pytest.mark.parametrize("existing_venue, candidate_venue", [
+    ("", "Living History Farms"),
+    ("Living History Farms", ""),
+])
+def test_missing_venue_matches_on_title_and_date(existing_venue, candidate_venue):
+    index = _index(("Fall Fest", existing_venue, DAY))
+    assert index.find("Fall Fest 2026", candidate_venue, DAY) == "Fall Fest"
+
+
+@pytest.mark.parametrize("offset, matches", [
+    (-2, False),
+    (-1, True),
+    (0, True),
+    (1, True),
+    (2, False),
+])
+def test_date_window_edges(offset, matches):
+    index = _index(("Fall Fest", "Living History Farms", DAY))
+    found = index.find("Fall Fest", "Living History Farms", DAY + timedelta(days=offset))
+    assert (found is not None) == matches
+
+
+def test_empty_title_is_ignored():
+    index = _index(("2026", "Anywhere", DAY))
+    assert len(index) == 0
+    assert index.find("The", "Anywhere", DAY) is None
+
+
+@pytest.mark.skipif(not os.environ.get("RUN_BENCHMARKS"), reason="benchmark; set RUN_BENCHMARKS=1 to run")
+def test_lookup_is_sub_millisecond_at_scale():
+    rng = random.Random(26)
+    words = ("music jazz night art show market farmers food truck festival "
+             "run race concert comedy theater film tour trivia yoga brunch").split()
+    index = NearDuplicateIndex()
+    for i in range(30000):
+        index.add(" ".join(rng.sample(words, 3)) + f" {i}", f"Venue {i % 50}", DAY + timedelta(days=i % 365))
+
+    lookups = 2000
+    started = time.perf_counter()
+    for i in range(lookups):
+        index.find(" ".join(rng.sample(words, 3)), "Venue 3", DAY + timedelta(days=i % 365))
+    per_lookup = (time.perf_counter() - started) / lookups
+
+    assert per_lookup < 0.001
@@ -0,0 +1,225 @@
+"""Tests for daemon mode: change detection, retries, state bounds and health."""
+
+import asyncio
+import json
+import time
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import catchdesmoines_crawler
+from conftest import FakeSite, FakeSupabase
+
+CENTRAL = ZoneInfo("America/Chicago")
+
+
+def _utc(local: str) -> str:
+    """ISO UTC timestamp for a Central Time 'YYYY-MM-DD HH:MM:SS' string, as stored in the database."""
+    return datetime.strptime(local, "%Y-%m-%d %H:%M:%S").replace(tzinfo=CENTRAL).astimezone(ZoneInfo("UTC")).isoformat()
+
+
+def _card(event_id, title, local_date, venue="Gray's Lake", **fields):
+    return {
+        "title": title,
+        "date": local_date,
+        "venue": venue,
+        "description": f"About {title}",
+        "detail_url": f"/event/{title.lower().replace(' ', '-')}/{event_id}/",
+        **fields,
+    }
+
+
+def _poll(crawler):
+    return asyncio.run(crawler.crawl_changed())
+
+
+def test_only_new_and_changed_cards_are_processed(make_daemon):
+    db = FakeSupabase()
+    site = FakeSite([
+        _card(101, "Farmers Market", "2030-05-04 07:00:00", venue="Court Avenue"),
+        _card(102, "Trivia Night", "2030-05-06 19:00:00", venue="Fong's Pizza"),
+    ])
+    crawler = make_daemon(site, db)
+
+    first = _poll(crawler)
+    assert (first["changed"], first["inserted"]) == (2, 2)
+    assert len(site.detail_crawls) == 2
+
+    # Unchanged listing page: served from the page cache, nothing re-processed
+    second = _poll(crawler)
+    assert second["changed"] == 0
+    assert len(site.anthropic.calls) == 1
+    assert len(site.detail_crawls) == 2
+
+    # One card moves to a later time: only it is re-crawled, and its own row is updated
+    site.events = [site.events[0], _card(102, "Trivia Night", "2030-05-06 20:00:00", venue="Fong's Pizza")]
+    third = _poll(crawler)
+    assert (third["changed"], third["updated"], third["inserted"]) == (1, 1, 0)
+    assert len(site.detail_crawls) == 3
+    assert len(db.rows) == 2
+    assert db.updates[0][0] == crawler.tracked_cards["102"]["row_id"]
+    assert db.row(db.updates[0][0])["event_start_local"] == "2030-05-06 20:00:00"
+
+
+def test_failed_insert_is_retried_next_poll(make_daemon):
+    db = FakeSupabase()
+    site = FakeSite([_card(401, "Sculpture Park Tour", "2030-07-12 10:00:00", venue="Pappajohn Sculpture Park")])
+    crawler = make_daemon(site, db)
+
+    db.fail_inserts = True
+    first = _poll(crawler)
+    assert first["failed"] == 1
+    assert "401" not in crawler.tracked_cards
+
+    db.fail_inserts = False
+    second = _poll(crawler)
+    assert (second["changed"], second["inserted"], second["failed"]) == (1, 1, 0)
+    assert crawler.tracked_cards["401"]["row_id"] == db.rows[0]["id"]
+
+
+def test_prune_drops_past_cards_and_caps_state(make_crawler, monkeypatch):
+    monkeypatch.setattr(catchdesmoines_crawler, "DAEMON_MAX_TRACKED_CARDS", 3)
+    monkeypatch.setattr(catchdesmoines_crawler, "DAEMON_MAX_RECENT_EVENTS", 2)
+    crawler = make_crawler()
+    today = datetime.now(CENTRAL).date()
+
+    crawler.tracked_cards = {
+        "past": {"hash": "", "row_id": 1, "date": today - timedelta(days=2)},
+        "yesterday": {"hash": "", "row_id": 2, "date": today - timedelta(days=1)},
+        "undated-1": {"hash": "", "row_id": 3, "date": None},
+        "undated-2": {"hash": "", "row_id": 4, "date": None},
+        "upcoming": {"hash": "", "row_id": 5, "date": today + timedelta(days=3)},
+    }
+    crawler.events_found = [{"title": f"Event {i}"} for i in range(5)]
+
+    crawler._prune_daemon_state()
+
+    # Cards from before yesterday go first, then the oldest entries beyond the cap
+    assert list(crawler.tracked_cards) == ["undated-1", "undated-2", "upcoming"]
+    assert [event["title"] for event in crawler.events_found] == ["Event 3", "Event 4"]
+
+
+def test_prune_caps_undated_cards_oldest_first(make_crawler, monkeypatch):
+    monkeypatch.setattr(catchdesmoines_crawler, "DAEMON_MAX_TRACKED_CARDS", 2)
+    crawler = make_crawler()
+    crawler.tracked_cards = {str(i): {"hash": "", "row_id": i, "date": None} for i in range(5)}
+
+    crawler._prune_daemon_state()
+
+    assert list(crawler.tracked_cards) == ["3", "4"]
+
+
+async def _get(crawler, path):
+    server = await asyncio.start_server(crawler._handle_health_request, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    try:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+    finally:
+        server.close()
+        await server.wait_closed()
+
+    head, _, body = response.decode().partition("\r\n\r\n")
+    return int(head.split()[1]), body
+
+
+def test_health_ok_after_recent_poll(make_crawler):
+    crawler = make_crawler()
+    crawler.poll_interval = 60
+    crawler.stats["polls"] = 4
+    crawler.stats["last_success_at"] = time.time() - 30
+
+    status, body = asyncio.run(_get(crawler, "/health"))
+
+    assert status == 200
+    assert json.loads(body)["status"] == "ok"
+    assert json.loads(body)["polls"] == 4
+
+
+def test_health_stale_without_recent_success(make_crawler):
+    crawler = make_crawler()
+    crawler.poll_interval = 60
+    crawler.stats["started_at"] = time.time() - 3600
+    crawler.stats["last_success_at"] = time.time() - 600
+
+    status, body = asyncio.run(_get(crawler, "/health"))
+
+    assert status == 503
+    assert json.loads(body)["status"] == "stale"
+
+
+def test_health_stale_when_no_poll_ever_succeeded(make_crawler):
+    crawler = make_crawler()
+    crawler.poll_interval = 60
+    crawler.stats["started_at"] = time.time() - 600
+
+    assert asyncio.run(_get(crawler, "/health"))[0] == 503
+
+
+def test_metrics_and_unknown_path(make_crawler):
+    crawler = make_crawler()
+    crawler.stats["polls"] = 7
+    crawler.events_inserted = 3
+    crawler.tracked_cards = {"1": {"hash": "", "row_id": 1, "date": None}}
+
+    status, body = asyncio.run(_get(crawler, "/metrics?format=text"))
+    metrics = dict(line.split(" ") for line in body.splitlines())
+
+    assert status == 200
+    assert metrics["crawler_polls_total"] == "7"
+    assert metrics["crawler_events_inserted_total"] == "3"
+    assert metrics["crawler_tracked_events"] == "1"
+    assert asyncio.run(_get(crawler, "/status"))[0] == 404
+
+
+def test_recurring_event_on_another_day_is_never_overwritten(make_daemon):
+    db = FakeSupabase([
+        {"title": "Holiday Lights", "venue": "Gray's Lake", "date": _utc("2030-12-01 18:00:00")},
+    ])
+    site = FakeSite([_card(222, "Holiday Lights", "2030-12-02 18:00:00")])
+    crawler = make_daemon(site, db)
+
+    first = _poll(crawler)
+    assert first["duplicates"] == 1
+    assert crawler.tracked_cards["222"]["row_id"] is None
+
+    # The Dec 2 occurrence changes; the Dec 1 row must stay as it is
+    site.events = [_card(222, "Holiday Lights", "2030-12-02 19:00:00")]
+    second = _poll(crawler)
+
+    assert second["changed"] == 1
+    assert second["updated"] == 0
+    assert db.updates == []
+    assert db.row(1)["date"] == _utc("2030-12-01 18:00:00")
+
+
+def test_same_day_duplicate_is_updated_when_its_card_changes(make_daemon):
+    db = FakeSupabase([
+        {"title": "Holiday Lights", "venue": "Gray's Lake", "date": _utc("2030-12-01 18:00:00")},
+    ])
+    site = FakeSite([_card(222, "Holiday Lights", "2030-12-01 18:00:00")])
+    crawler = make_daemon(site, db)
+
+    _poll(crawler)
+    assert crawler.tracked_cards["222"]["row_id"] == 1
+
+    site.events = [_card(222, "Holiday Lights", "2030-12-01 19:30:00")]
+    result = _poll(crawler)
+
+    assert result["updated"] == 1
+    assert db.row(1)["event_start_local"] == "2030-12-01 19:30:00"
+
+
+def test_reworded_description_is_not_a_change(make_daemon):
+    site = FakeSite([_card(301, "Jazz in the Gardens", "2030-06-05 17:00:00", category="Music", price="Free")])
+    crawler = make_daemon(site, FakeSupabase())
+    _poll(crawler)
+
+    site.events = [_card(301, "Jazz in the Gardens", "2030-06-05 17:00:00",
+                         description="Live jazz downtown.", category="Concerts", price="$0")]
+    result = _poll(crawler)
+
+    assert result["changed"] == 0
+    assert len(site.detail_crawls) == 1
@@ -0,0 +1,137 @@
+"""Tests for packing several listing pages into one Claude request."""
+
+import asyncio
+import json
+
+from catchdesmoines_crawler import PACK_MAX_OUTPUT_TOKENS
+from conftest import FakeAnthropic, listing_html, packed_page_ids
+
+
+def _page_events(page: int) -> str:
+    return json.dumps([{"title": f"Event on page {page}"}])
+
+
+def _answer_all(prompt: str) -> str:
+    if "<page id=" not in prompt:
+        return json.dumps([{"title": "single"}])
+    return "".join(
+        f'<page_events id="{page}">{_page_events(page)}</page_events>'
+        for page in packed_page_ids(prompt)
+    )
+
+
+def test_batches_cut_at_input_budget(make_crawler):
+    crawler = make_crawler(pack_tokens=25000)
+    # ~10k input tokens per page: two fit with the prompt overhead, three don't
+    pages = [(page, listing_html(page) + "x" * 40000) for page in range(5)]
+
+    batches = crawler._pack_pages(pages)
+
+    assert [[page for page, _ in batch] for batch in batches] == [[0, 1], [2, 3], [4]]
+
+
+def test_page_larger_than_budget_is_sent_alone(make_crawler):
+    crawler = make_crawler(pack_tokens=5000)
+    pages = [(0, listing_html(1)), (1, listing_html(2) + "x" * 40000), (2, listing_html(3))]
+
+    batches = crawler._pack_pages(pages)
+
+    assert [[page for page, _ in batch] for batch in batches] == [[0], [1], [2]]
+
+
+def test_batches_cut_at_expected_output(make_crawler):
+    crawler = make_crawler(pack_tokens=1_000_000)
+    # A full listing page has 12 cards
+    pages = [(page, listing_html(*range(page * 12, page * 12 + 12))) for page in range(12)]
+
+    batches = crawler._pack_pages(pages)
+
+    assert [len(batch) for batch in batches] == [5, 5, 2]
+    for batch in batches:
+        expected = sum(crawler._expected_output_tokens(html) for _, html in batch)
+        assert expected <= PACK_MAX_OUTPUT_TOKENS
+
+
+def test_expected_output_counts_distinct_event_links(make_crawler):
+    crawler = make_crawler()
+    # The same card linked twice (title and image) counts once
+    html = listing_html(1, 2, 3) + listing_html(1)
+
+    assert crawler._expected_output_tokens(html) == crawler._expected_output_tokens(listing_html(1, 2, 3))
+    assert crawler._expected_output_tokens(listing_html(1, 2)) < crawler._expected_output_tokens(listing_html(1, 2, 3))
+
+
+def test_page_without_event_links_gets_single_page_allowance(make_crawler):
+    crawler = make_crawler(pack_tokens=1_000_000)
+    pages = [(0, "<div>no cards</div>"), (1, "<div>no cards</div>"), (2, "<div>no cards</div>")]
+
+    batches = crawler._pack_pages(pages)
+
+    assert [len(batch) for batch in batches] == [2, 1]
+
+
+def test_packed_output_is_split_per_page(make_crawler):
+    anthropic = FakeAnthropic(_answer_all)
+    crawler = make_crawler(anthropic=anthropic, pack_tokens=100000)
+    batch = [(3, listing_html(1)), (4, listing_html(2)), (5, listing_html(3))]
+
+    results = asyncio.run(crawler.extract_packed_events_with_claude(batch))
+
+    assert results == {page: json.loads(_page_events(page)) for page in (3, 4, 5)}
+    assert len(anthropic.calls) == 1
+    assert anthropic.calls[0]["max_tokens"] == PACK_MAX_OUTPUT_TOKENS
+
+
+def test_ids_outside_the_batch_are_ignored(make_crawler):
+    def respond(prompt):
+        return (
+            f'<page_events id="0">{_page_events(0)}</page_events>'
+            f'<page_events id="7">{_page_events(7)}</page_events>'
+        )
+
+    anthropic = FakeAnthropic(respond)
+    crawler = make_crawler(anthropic=anthropic, pack_tokens=100000)
+
+    results = asyncio.run(crawler.extract_packed_events_with_claude([(0, listing_html(1))]))
+
+    assert results == {0: json.loads(_page_events(0))}
+    assert anthropic.single_calls == []
+
+
+def test_missing_and_truncated_blocks_fall_back_to_single_page(make_crawler):
+    def respond(prompt):
+        if "<page id=" not in prompt:
+            return json.dumps([{"title": "single"}])
+        # Page 1 is missing and page 2 is cut off mid-array
+        return (
+            f'<page_events id="0">{_page_events(0)}</page_events>'
+            '<page_events id="2">[{"title": "Event on'
+        )
+
+    anthropic = FakeAnthropic(respond)
+    crawler = make_crawler(anthropic=anthropic, pack_tokens=100000)
+    batch = [(0, listing_html(1)), (1, listing_html(2)), (2, listing_html(3))]
+
+    results = asyncio.run(crawler.extract_packed_events_with_claude(batch))
+
+    assert results[0] == json.loads(_page_events(0))
+    assert results[1] == results[2] == [{"title": "single"}]
+    assert len(anthropic.packed_calls) == 1
+    assert len(anthropic.single_calls) == 2
+    assert listing_html(2) in anthropic.single_calls[0]["prompt"]
+    assert listing_html(3) in anthropic.single_calls[1]["prompt"]
+
+
+def test_api_error_falls_back_for_every_page(make_crawler):
+    def respond(prompt):
+        if "<page id=" in prompt:
+            return RuntimeError("overloaded")
+        return json.dumps([{"title": "single"}])
+
+    anthropic = FakeAnthropic(respond)
+    crawler = make_crawler(anthropic=anthropic, pack_tokens=100000)
+
+    results = asyncio.run(crawler.extract_packed_events_with_claude([(0, listing_html(1)), (1, listing_html(2))]))
+
+    assert results == {0: [{"title": "single"}], 1: [{"title": "single"}]}
+    assert len(anthropic.single_calls) == 2